@@ -0,0 +1,78 @@
+import functools
+
+# Numba je volitelná, bez ní běží Feistelova kola v čistém Pythonu
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# referenční model simon 32/64, rotace jsou ve smyčkách rozepsané přímo
+Z0 = 0b11111010001001010110000111001101111101000100101011000011100110
+
+@functools.lru_cache(maxsize=256)
+def _expand_key(key_int):
+    # rozvinutí klíče předem, k0..k3 je posuvné okno nad plánem klíčů
+    round_keys = [0] * 32
+    k0 = key_int & 0xFFFF; k1 = (key_int >> 16) & 0xFFFF
+    k2 = (key_int >> 32) & 0xFFFF; k3 = (key_int >> 48) & 0xFFFF
+    for i in range(32):
+        round_keys[i] = k0
+        tmp = ((k3 >> 3) | ((k3 << 13) & 0xFFFF)) ^ k1
+        k_new = 0xFFFC ^ ((Z0 >> (61 - i)) & 1) ^ k0 ^ tmp ^ ((tmp >> 1) | ((tmp << 15) & 0xFFFF))
+        k0, k1, k2, k3 = k1, k2, k3, k_new
+    return tuple(round_keys)
+
+def _simon_encrypt(plaintext_int, round_keys):
+    # Feistelova kola s rotacemi rozepsanými přímo
+    L = (plaintext_int >> 16) & 0xFFFF; R = plaintext_int & 0xFFFF
+    for k in round_keys:
+        f_val = ((((L << 1) | (L >> 15)) & ((L << 8) | (L >> 8))) ^ ((L << 2) | (L >> 14))) & 0xFFFF
+        L, R = R ^ f_val ^ k, L
+    return (L << 16) | R
+
+def _simon_core(plaintext_int, key_lo, key_hi):
+    # celé šifrování pro Numbu: klíč jako dvě 32-bit poloviny, aby všechny
+    # mezivýsledky zůstaly v int64, plán klíčů se počítá během kol
+    k0 = key_lo & 0xFFFF; k1 = key_lo >> 16
+    k2 = key_hi & 0xFFFF; k3 = key_hi >> 16
+    L = (plaintext_int >> 16) & 0xFFFF; R = plaintext_int & 0xFFFF
+    for i in range(32):
+        f_val = ((((L << 1) | (L >> 15)) & ((L << 8) | (L >> 8))) ^ ((L << 2) | (L >> 14))) & 0xFFFF
+        L, R = R ^ f_val ^ k0, L
+        tmp = ((k3 >> 3) | ((k3 << 13) & 0xFFFF)) ^ k1
+        k_new = 0xFFFC ^ ((Z0 >> (61 - i)) & 1) ^ k0 ^ tmp ^ ((tmp >> 1) | ((tmp << 15) & 0xFFFF))
+        k0, k1, k2, k3 = k1, k2, k3, k_new
+    return (L << 16) | R
+
+if njit is not None:
+    # kola přeložená do nativního kódu, cache=True uloží překlad mezi běhy
+    _simon_core = njit(cache=True)(_simon_core)
+
+    def simon_32_64_gold(plaintext_int, key_int):
+        return _simon_core(plaintext_int, key_int & 0xFFFFFFFF, key_int >> 32)
+else:
+    def simon_32_64_gold(plaintext_int, key_int):
+        return _simon_encrypt(plaintext_int, _expand_key(key_int))
+
+def simon_32_64_gold_batch(plaintexts, keys):
+    # vektorová verze referenčního modelu pro N dvojic (plaintext, klíč),
+    # každé kolo je jedna numpy operace nad všemi N bloky;
+    # numpy se načítá až tady, skalární model ji nepotřebuje
+    import numpy as np
+
+    def _rotl16(x, k): return ((x << k) | (x >> (16 - k))).astype(np.uint16)
+
+    pts = np.asarray(plaintexts, dtype=np.uint32)
+    keys = np.asarray(keys, dtype=np.uint64)
+    k0, k1, k2, k3 = [((keys >> np.uint64(16 * i)) & np.uint64(0xFFFF)).astype(np.uint16) for i in range(4)]
+    round_keys = np.empty((32, pts.shape[0]), dtype=np.uint16)
+    for i in range(32):
+        round_keys[i] = k0
+        tmp = _rotl16(k3, 13) ^ k1
+        k_new = np.uint16(0xFFFC ^ ((Z0 >> (61 - i)) & 1)) ^ k0 ^ tmp ^ _rotl16(tmp, 15)
+        k0, k1, k2, k3 = k1, k2, k3, k_new
+
+    L = (pts >> 16).astype(np.uint16); R = (pts & 0xFFFF).astype(np.uint16)
+    for rk in round_keys:
+        L, R = R ^ ((_rotl16(L, 1) & _rotl16(L, 8)) ^ _rotl16(L, 2)) ^ rk, L
+    return (L.astype(np.uint32) << 16) | R
@@ -0,0 +1,26 @@
+# cython: language_level=3
+# referenční model simon 32/64 přeložený Cythonem (volitelný, jinak simon_ref.py)
+cimport cython
+
+# stejná z0 sekvence jako v simon_ref.Z0
+cdef unsigned long long Z0 = 0x3E8958737D12B0E6ULL
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef unsigned int simon_encrypt(unsigned int pt, unsigned long long key):
+    cdef unsigned short L = (pt >> 16) & 0xFFFF
+    cdef unsigned short R = pt & 0xFFFF
+    cdef unsigned short k0 = key & 0xFFFF
+    cdef unsigned short k1 = (key >> 16) & 0xFFFF
+    cdef unsigned short k2 = (key >> 32) & 0xFFFF
+    cdef unsigned short k3 = (key >> 48) & 0xFFFF
+    cdef unsigned short tmp, f_val, k_new
+    cdef int i
+
+    for i in range(32):
+        f_val = ((((L << 1) | (L >> 15)) & ((L << 8) | (L >> 8))) ^ ((L << 2) | (L >> 14))) & 0xFFFF
+        L, R = R ^ f_val ^ k0, L
+        tmp = (((k3 >> 3) | (k3 << 13)) & 0xFFFF) ^ k1
+        k_new = 0xFFFC ^ ((Z0 >> (61 - i)) & 1) ^ k0 ^ tmp ^ (((tmp >> 1) | (tmp << 15)) & 0xFFFF)
+        k0, k1, k2, k3 = k1, k2, k3, k_new
+    return (<unsigned int>L << 16) | R
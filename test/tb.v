@@ -1,8 +1,8 @@
 `default_nettype none
 `timescale 1ns / 1ps
 
-/* This testbench instantiates the TT module and provides
-   open-drain I2C simulation wires for cocotb test.py.
+/* This testbench instantiates the TT module, generates the clock and
+   provides open-drain I2C simulation wires for cocotb test.py.
 */
 
 module tb ();
@@ -16,6 +16,12 @@ module tb ();
 
   // Wire up the inputs and outputs:
   reg clk;
+
+  // 100 MHz clock generated in HDL, so cocotb does not have to drive
+  // every clock edge from Python
+  initial clk = 1'b0;
+  always #5 clk = ~clk;
+
   reg rst_n;
   reg ena;
   reg [7:0] ui_in;